@@ -8,17 +8,23 @@ You, the operator, may broadcast announcements or observe in silence.
 """
 
 import asyncio
+import ctypes
 import threading
 import time
 import json
 import os
+import shutil
 import tempfile
 import subprocess
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
-from queue import Queue
+from queue import Empty, Queue
 
 # Voice synthesis (optional)
 try:
@@ -44,6 +50,7 @@ ANTHROPIC_BASE_URL = "https://z.ai/api/anthropic"
 # Agent configuration
 MODEL = "claude-3-5-sonnet-latest"  # or "claude-3-5-haiku-latest" for economy
 HEARTBEAT_INTERVAL = 60  # seconds between time updates
+MAX_CONCURRENT_REQUESTS = 4  # parallel Letta calls during a broadcast or heartbeat
 ROOM_NAME = "The Observatory"
 
 # Voice configuration (edge-tts)
@@ -57,6 +64,26 @@ VOICE_MAP = {
 }
 VOICE_RATE = "+0%"  # Speaking rate adjustment
 VOICE_VOLUME = "+0%"  # Volume adjustment
+VOICE_QUEUE_LIMIT = 8  # Pending utterances before the oldest is dropped
+AUDIO_CACHE_SIZE = 128  # Synthesized clips kept for repeated phrases
+AUDIO_CACHE_MAX_CHARS = 200  # Longer utterances are rarely repeated, so aren't cached
+
+# Common mpv locations on Windows, checked when mpv isn't on PATH
+MPV_PATHS = [
+    r'C:\ProgramData\chocolatey\bin\mpv.exe',  # Chocolatey
+    r'C:\tools\mpv\mpv.exe',  # Common manual install
+    os.path.expanduser(r'~\scoop\apps\mpv\current\mpv.exe'),  # Scoop
+    os.path.expanduser(r'~\AppData\Local\Programs\mpv\mpv.exe'),  # Local install
+]
+
+# Player arguments; '{file}' is replaced with a clip path, '-' reads MP3 from stdin
+PLAYER_ARGS = {
+    'afplay': ['{file}'],
+    'mpg123': ['-q', '-'],
+    'mpv': ['--really-quiet', '--no-video', '-'],
+    'ffplay': ['-nodisp', '-autoexit', '-loglevel', 'quiet', '-i', '-'],
+    'paplay': ['{file}'],
+}
 
 # ============================================================================
 # AGENT PERSONAS
@@ -92,39 +119,91 @@ authentic to your persona while engaging meaningfully with others.
 
 Time flows. Ideas evolve. Patterns emerge."""
 
+# Fixed per-agent text, formatted once at import rather than on every create()
+_SYSTEM = SYSTEM_PROMPT.format(room_name=ROOM_NAME)
+_HUMAN = {
+    name: f"Other agents in the room: {', '.join(PERSONAS)}. You are {name}."
+    for name in PERSONAS
+}
+
 # ============================================================================
 # ROOM STATE MANAGEMENT
 # ============================================================================
 
+# Presence is tracked as a bitmask over the fixed cast
+NAME_BIT = {name: 1 << i for i, name in enumerate(PERSONAS)}
+ALL_AGENTS_MASK = (1 << len(NAME_BIT)) - 1
+
+def _history() -> deque:
+    """One column of the message log; oldest entries are evicted automatically"""
+    return deque(maxlen=50)
+
+@dataclass
+class MsgLog:
+    """Recent messages stored column-wise, one bounded deque per field"""
+    times: Deque[datetime] = field(default_factory=_history)
+    senders: Deque[str] = field(default_factory=_history)
+    recipients: Deque[str] = field(default_factory=_history)
+    contents: Deque[str] = field(default_factory=_history)
+    previews: Deque[str] = field(default_factory=_history)  # First 50 chars, cut once on ingest
+    
+    def append(self, when: datetime, sender: str, recipient: str, content: str):
+        self.times.append(when)
+        self.senders.append(sender)
+        self.recipients.append(recipient)
+        self.contents.append(content)
+        self.previews.append(content[:50])
+        
+    def last(self, n: int, preview: bool = False) -> List[Tuple[datetime, str, str, str]]:
+        """Up to the n most recent (time, sender, recipient, content) rows, oldest first.
+        With preview=True the content column is the truncated preview."""
+        start = max(len(self.times) - n, 0)
+        columns = (self.times, self.senders, self.recipients, self.previews if preview else self.contents)
+        return list(zip(*(islice(column, start, None) for column in columns)))
+        
+    def __len__(self) -> int:
+        return len(self.times)
+
 @dataclass
 class RoomState:
     """Tracks who's present and what's happened"""
-    agents_present: Set[str] = field(default_factory=set)
-    agents_alone: Set[str] = field(default_factory=set)
-    recent_messages: List[Dict] = field(default_factory=list)
-    start_time: datetime = field(default_factory=datetime.now)
+    present_mask: int = 0  # One NAME_BIT per agent in the room
+    recent_messages: MsgLog = field(default_factory=MsgLog)
+    start_monotonic: float = field(init=False)
+    
+    def __post_init__(self):
+        self.start_monotonic = time.monotonic()
     
     def add_message(self, sender: str, content: str, recipient: Optional[str] = None):
         """Log a message to room history"""
-        msg = {
-            "time": datetime.now().strftime("%H:%M:%S"),
-            "sender": sender,
-            "content": content,
-            "recipient": recipient or "room"
-        }
-        self.recent_messages.append(msg)
-        # Keep only last 50 messages
-        if len(self.recent_messages) > 50:
-            self.recent_messages.pop(0)
+        # Time is kept raw and formatted only when displayed
+        self.recent_messages.append(datetime.now(), sender, recipient or "room", content)
+        
+    def last_messages(self, n: int, preview: bool = False) -> List[Tuple[datetime, str, str, str]]:
+        """Return up to the n most recent messages, oldest first"""
+        return self.recent_messages.last(n, preview)
     
+    def enter(self, name: str):
+        """Mark an agent as present"""
+        self.present_mask |= NAME_BIT[name]
+        
+    def leave(self, name: str):
+        """Mark an agent as away"""
+        self.present_mask &= ~NAME_BIT[name]
+        
     def get_present_agents(self) -> List[str]:
         """Return list of agents currently in room"""
-        return list(self.agents_present)
+        return [name for name, bit in NAME_BIT.items() if self.present_mask & bit]
+    
+    def get_alone_agents(self) -> List[str]:
+        """Return list of agents currently in solitude"""
+        alone_mask = ~self.present_mask & ALL_AGENTS_MASK
+        return [name for name, bit in NAME_BIT.items() if alone_mask & bit]
     
     def time_elapsed(self) -> str:
         """Human-readable time since room opened"""
-        delta = datetime.now() - self.start_time
-        hours, remainder = divmod(delta.seconds, 3600)
+        elapsed = int(time.monotonic() - self.start_monotonic)
+        hours, remainder = divmod(elapsed, 3600)
         minutes, seconds = divmod(remainder, 60)
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
@@ -132,6 +211,9 @@ class RoomState:
 # VOICE SYNTHESIS
 # ============================================================================
 
+# Markdown punctuation that would otherwise be read aloud, stripped in one pass
+_TTS_STRIP = str.maketrans('', '', '*_#`~>|')
+
 class VoiceSynthesizer:
     """Handles text-to-speech for agent dialogue"""
     
@@ -140,36 +222,31 @@ class VoiceSynthesizer:
         self.voice_queue = Queue()
         self.voice_thread = None
         self.running = False
+        self._play_path: Optional[str] = None  # Resolved once; reused for every utterance
+        self._play_args: List[str] = []
+        self._clip_path: Optional[str] = None
         self.audio_player = self._detect_audio_player()
+        self._audio_cache: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
         
     def _detect_audio_player(self):
-        """Detect which audio player is available"""
+        """Detect which audio player is available and remember how to invoke it"""
         if not self.enabled:
             return None
             
-        if os.name == 'posix':
-            if os.path.exists('/usr/bin/afplay'):
-                return "afplay (macOS)"
-            for player in ['mpg123', 'mpv', 'ffplay', 'paplay']:
-                if os.path.exists(f'/usr/bin/{player}'):
-                    return f"{player} (Linux)"
-        elif os.name == 'nt':
-            # Check for mpv on Windows
-            mpv_paths = [
-                'mpv',
-                r'C:\ProgramData\chocolatey\bin\mpv.exe',
-                r'C:\tools\mpv\mpv.exe',
-                os.path.expanduser(r'~\scoop\apps\mpv\current\mpv.exe'),
-                os.path.expanduser(r'~\AppData\Local\Programs\mpv\mpv.exe'),
-            ]
-            for mpv_path in mpv_paths:
-                try:
-                    result = subprocess.run([mpv_path, '--version'], capture_output=True, timeout=1)
-                    if result.returncode == 0:
-                        return "mpv (Windows)"
-                except:
-                    continue
-            return "Windows Media Player (fallback)"
+        # Stdin-capable players first, so audio can stream instead of going via a file
+        for player in ('mpv', 'ffplay', 'mpg123', 'paplay', 'afplay'):
+            path = shutil.which(player)
+            if path:
+                self._play_path, self._play_args = path, PLAYER_ARGS[player]
+                return player
+                
+        if os.name == 'nt':
+            # mpv installs that aren't on PATH
+            for mpv_path in MPV_PATHS:
+                if os.path.isfile(mpv_path):
+                    self._play_path, self._play_args = mpv_path, PLAYER_ARGS['mpv']
+                    return "mpv"
+            return "Windows MCI (fallback)"
         return "unknown"
         
     def start(self):
@@ -184,126 +261,223 @@ class VoiceSynthesizer:
         
     def _voice_worker(self):
         """Background thread that processes voice queue"""
-        while self.running:
-            try:
-                if not self.voice_queue.empty():
-                    speaker, text = self.voice_queue.get(timeout=0.1)
-                    asyncio.run(self._speak(speaker, text))
-                else:
-                    time.sleep(0.1)
-            except:
-                time.sleep(0.1)
+        # One event loop for the thread's lifetime, not one per utterance
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            while True:
+                item = self.voice_queue.get()  # Blocks until work (or shutdown) arrives
+                if item is None or not self.running:  # Sentinel from stop(), or stopping
+                    break
+                speaker, text = item
+                try:
+                    loop.run_until_complete(self._speak(speaker, text))
+                except Exception as e:
+                    print(f"Voice worker error: {e}")
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+            # Only this thread writes the scratch clip, so it's safe to remove here
+            if self._clip_path:
+                try:
+                    os.unlink(self._clip_path)
+                except OSError:
+                    pass
+                
+    def _open_stream_player(self) -> Optional[subprocess.Popen]:
+        """Launch the player on stdin, or None if it can only read a file"""
+        if not self._play_path or '-' not in self._play_args:
+            return None
+        try:
+            return subprocess.Popen(
+                [self._play_path] + self._play_args,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            return None
+        
+    async def _synthesize(self, clean_text: str, voice: str):
+        """Yield MP3 chunks from edge-tts as they arrive"""
+        tts = edge_tts.Communicate(
+            clean_text, 
+            voice,
+            rate=VOICE_RATE,
+            volume=VOICE_VOLUME
+        )
+        async for chunk in tts.stream():
+            if chunk["type"] == "audio":
+                yield chunk["data"]
                 
+    @staticmethod
+    async def _replay(audio: bytes):
+        """Yield previously synthesized audio as a single chunk"""
+        yield audio
+        
+    async def _stream_to_player(self, chunks, proc: subprocess.Popen) -> Optional[bytes]:
+        """Pipe audio chunks into the player as they arrive; return the full clip"""
+        buf = bytearray()
+        try:
+            async for data in chunks:
+                # Buffered write takes the whole chunk; flush hands it over right away
+                proc.stdin.write(data)
+                proc.stdin.flush()
+                buf += data
+        except BrokenPipeError:
+            return None  # Player exited early; the clip is incomplete
+        finally:
+            await chunks.aclose()  # Close the edge-tts WebSocket now, not at GC
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+            proc.wait()
+        return bytes(buf)
+            
+    async def _play_from_file(self, audio: bytes):
+        """Fallback for players that can only read a file"""
+        clip_path = self._clip_file()
+        with open(clip_path, 'wb') as clip:
+            clip.write(audio)
+            
+        # Play the audio with the player found at startup
+        if self._play_path and '{file}' in self._play_args:
+            subprocess.run(
+                [self._play_path] + [arg.format(file=clip_path) for arg in self._play_args],
+                stdout=subprocess.DEVNULL,  # Never read, so don't buffer it
+                stderr=subprocess.DEVNULL
+            )
+        elif os.name == 'nt':  # Windows without mpv
+            self._play_with_mci(clip_path)
+            
+    @staticmethod
+    def _play_with_mci(path: str):
+        """Play an MP3 in-process through Windows' built-in MCI (no process spawn)"""
+        mci = ctypes.windll.winmm.mciSendStringW
+        if mci(f'open "{path}" type mpegvideo alias clip', None, 0, None):
+            raise OSError(f"MCI could not open {path}")
+        try:
+            mci('play clip wait', None, 0, None)
+        finally:
+            mci('close clip', None, 0, None)
+            
+    def _clip_file(self) -> str:
+        """Scratch file reused by every utterance that needs an on-disk clip"""
+        if self._clip_path is None:
+            fd, self._clip_path = tempfile.mkstemp(suffix=".mp3")
+            os.close(fd)
+        return self._clip_path
+        
+    def _cache_audio(self, key: Tuple[str, str], audio: bytes):
+        """Remember a synthesized clip, evicting the least recently used"""
+        self._audio_cache[key] = audio
+        self._audio_cache.move_to_end(key)
+        if len(self._audio_cache) > AUDIO_CACHE_SIZE:
+            self._audio_cache.popitem(last=False)
+            
     async def _speak(self, speaker: str, text: str):
         """Generate and play speech"""
         voice = VOICE_MAP.get(speaker, "en-US-AriaNeural")
         
         # Clean text for speech (remove markdown, etc.)
-        clean_text = text.replace("*", "").replace("_", "").replace("#", "")
+        clean_text = text.translate(_TTS_STRIP)
+        
+        key = (speaker, clean_text)
+        audio = self._audio_cache.get(key)
+        if audio is not None:
+            self._audio_cache.move_to_end(key)
         
         try:
-            # Generate speech to temp file
-            with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp_file:
-                tts = edge_tts.Communicate(
-                    clean_text, 
-                    voice,
-                    rate=VOICE_RATE,
-                    volume=VOICE_VOLUME
-                )
-                await tts.save(tmp_file.name)
+            # Stream straight into the player when it can read stdin
+            proc = self._open_stream_player()
+            if proc:
+                chunks = self._replay(audio) if audio is not None else self._synthesize(clean_text, voice)
+                played = await self._stream_to_player(chunks, proc)
+                if audio is None:
+                    audio = played
+            else:
+                if audio is None:
+                    audio = b"".join([data async for data in self._synthesize(clean_text, voice)])
+                await self._play_from_file(audio)
                 
-                # Play the audio (platform-specific)
-                if os.name == 'posix':  # Linux/Mac
-                    if os.path.exists('/usr/bin/afplay'):  # macOS
-                        subprocess.run(['afplay', tmp_file.name], capture_output=True)
-                    else:  # Linux - try multiple players
-                        for player in ['mpg123', 'mpv', 'ffplay', 'paplay']:
-                            if os.path.exists(f'/usr/bin/{player}'):
-                                if player == 'ffplay':
-                                    subprocess.run([player, '-nodisp', '-autoexit', tmp_file.name], 
-                                                 capture_output=True, stderr=subprocess.DEVNULL)
-                                else:
-                                    subprocess.run([player, tmp_file.name], capture_output=True)
-                                break
-                elif os.name == 'nt':  # Windows
-                    # First try mpv (likely installed via chocolatey or scoop)
-                    mpv_played = False
-                    
-                    # Check common mpv locations
-                    mpv_paths = [
-                        'mpv',  # In PATH
-                        r'C:\ProgramData\chocolatey\bin\mpv.exe',  # Chocolatey
-                        r'C:\tools\mpv\mpv.exe',  # Common manual install
-                        os.path.expanduser(r'~\scoop\apps\mpv\current\mpv.exe'),  # Scoop
-                        os.path.expanduser(r'~\AppData\Local\Programs\mpv\mpv.exe'),  # Local install
-                    ]
-                    
-                    for mpv_path in mpv_paths:
-                        try:
-                            # Try to run mpv with minimal UI
-                            result = subprocess.run(
-                                [mpv_path, '--really-quiet', '--no-video', tmp_file.name],
-                                capture_output=True,
-                                timeout=10
-                            )
-                            if result.returncode == 0:
-                                mpv_played = True
-                                break
-                        except (FileNotFoundError, subprocess.TimeoutExpired):
-                            continue
-                    
-                    # Fall back to Windows Media Player if mpv didn't work
-                    if not mpv_played:
-                        try:
-                            # Try using Windows' built-in playback (Windows 10+)
-                            subprocess.run(
-                                ['powershell', '-Command', f'(New-Object Media.SoundPlayer "{tmp_file.name}").PlaySync()'],
-                                capture_output=True,
-                                timeout=10
-                            )
-                        except:
-                            # Ultimate fallback: ancient Windows Media Player
-                            os.system(f'start /min wmplayer {tmp_file.name}')
-                            time.sleep(3)  # Give it time to play
-                    
-                # Clean up
-                os.unlink(tmp_file.name)
+            # Only short phrases (announcements, acknowledgements) tend to repeat
+            if audio and len(clean_text) <= AUDIO_CACHE_MAX_CHARS:
+                self._cache_audio(key, audio)
                 
         except Exception as e:
             print(f"Voice synthesis error: {e}")
             
     def say(self, speaker: str, text: str):
         """Queue text for speech synthesis"""
-        if self.enabled and text and len(text) > 5:  # Don't speak very short utterances
-            self.voice_queue.put((speaker, text))
+        if not (self.enabled and text and len(text) > 5):  # Don't speak very short utterances
+            return
+        item = (speaker, text)
+        with self.voice_queue.mutex:
+            if item in self.voice_queue.queue:  # e.g. the same broadcast sent twice
+                return
+        # Under a burst, drop the stalest line rather than fall further behind
+        if self.voice_queue.qsize() >= VOICE_QUEUE_LIMIT:
+            try:
+                self.voice_queue.get_nowait()
+            except Empty:
+                pass
+        self.voice_queue.put(item)
             
     def stop(self):
         """Stop voice synthesis"""
         self.running = False
         if self.voice_thread:
+            # Drop pending lines so the worker exits after the current utterance
+            with self.voice_queue.mutex:
+                self.voice_queue.queue.clear()
+            self.voice_queue.put(None)  # Wake the worker so it can exit
             self.voice_thread.join(timeout=2)
 
 # ============================================================================
 # AGENT WRAPPER
 # ============================================================================
 
+class OtherAgents(Mapping):
+    """Read-only view of the room's shared name -> agent_id map, minus one agent"""
+    
+    def __init__(self, agent_ids: Dict[str, str], exclude: str):
+        self._agent_ids = agent_ids
+        self._exclude = exclude
+        
+    def __getitem__(self, name: str) -> str:
+        if name == self._exclude:
+            raise KeyError(name)
+        return self._agent_ids[name]
+        
+    def __iter__(self):
+        return (name for name in self._agent_ids if name != self._exclude)
+        
+    def __len__(self) -> int:
+        return len(self._agent_ids) - (self._exclude in self._agent_ids)
+
 class RoomAgent:
     """Wrapper for a Letta agent with room awareness"""
     
-    def __init__(self, name: str, client: letta.Client, room_state: RoomState):
+    def __init__(self, name: str, client: letta.Client, room_state: RoomState, agent_ids: Dict[str, str]):
         self.name = name
         self.client = client
         self.room_state = room_state
         self.is_present = True
         self.agent_id = None
-        self.other_agents = {}  # name -> agent_id mapping
+        self._agent_ids = agent_ids  # Shared by every agent in the room
         
-    def create(self):
-        """Initialize the Letta agent"""
+    @property
+    def other_agents(self) -> OtherAgents:
+        """name -> agent_id mapping of everyone else in the room"""
+        return OtherAgents(self._agent_ids, self.name)
+        
+    def create(self, tools: List[str]):
+        """Initialize the Letta agent with the room's resolved tool list"""
         # Create memory blocks
         memory = ChatMemory(
             human=Block(
-                value=f"Other agents in the room: Alice, Bob, Charlie, Diana. You are {self.name}.",
+                value=_HUMAN[self.name],
                 limit=2000
             ),
             persona=Block(
@@ -320,31 +494,26 @@ class RoomAgent:
             ]
         )
         
-        # Create agent with inter-agent messaging tool
-        tools = []
-        if self.client.list_tools(name="send_message_to_agent"):
-            tools.append("send_message_to_agent")
-        
         agent_state = self.client.create_agent(
             name=f"agent_{self.name.lower()}",
-            system=SYSTEM_PROMPT.format(room_name=ROOM_NAME),
+            system=_SYSTEM,
             memory=memory,
             model=MODEL,
             tools=tools
         )
         
         self.agent_id = agent_state.id
-        self.room_state.agents_present.add(self.name)
+        self.room_state.enter(self.name)
         
-    def update_time_context(self):
+    def update_time_context(self, now: Optional[datetime] = None):
         """Update agent's temporal awareness"""
         if not self.agent_id:
             return
             
-        current_time = datetime.now().strftime("%H:%M:%S")
+        current_time = (now or datetime.now()).strftime("%H:%M:%S")
         location = "alone in contemplation" if not self.is_present else f"in {ROOM_NAME}"
         
-        others_present = [a for a in self.room_state.agents_present if a != self.name]
+        others_present = [a for a in self.room_state.get_present_agents() if a != self.name]
         if self.is_present and others_present:
             location += f". Also present: {', '.join(others_present)}"
         
@@ -367,18 +536,20 @@ class RoomAgent:
         )
         
         # Extract the assistant's response
-        for msg in response.messages:
-            if msg.role == "assistant":
-                return msg.text or msg.tool_calls[0].function.arguments if msg.tool_calls else "..."
-        
-        return "..."
+        reply = next((msg for msg in response.messages if msg.role == "assistant"), None)
+        if reply is None:
+            return "..."
+        return reply.text or (reply.tool_calls[0].function.arguments if reply.tool_calls else "...")
+    
+    async def send_message_async(self, content: str, sender: str = "System") -> str:
+        """Send a message without blocking the event loop"""
+        return await asyncio.to_thread(self.send_message, content, sender)
     
     def leave_room(self):
         """Agent goes to be alone"""
         if self.is_present:
             self.is_present = False
-            self.room_state.agents_present.discard(self.name)
-            self.room_state.agents_alone.add(self.name)
+            self.room_state.leave(self.name)
             self.update_time_context()
             return f"{self.name} withdraws into solitude."
         return f"{self.name} is already alone."
@@ -387,8 +558,7 @@ class RoomAgent:
         """Agent returns from solitude"""
         if not self.is_present:
             self.is_present = True
-            self.room_state.agents_alone.discard(self.name)
-            self.room_state.agents_present.add(self.name)
+            self.room_state.enter(self.name)
             self.update_time_context()
             return f"{self.name} returns to the room."
         return f"{self.name} is already present."
@@ -415,7 +585,10 @@ class Room:
             
         self.room_state = RoomState()
         self.agents: Dict[str, RoomAgent] = {}
+        self._agent_ids: Dict[str, str] = {}  # name -> agent_id, shared with every agent
         self.heartbeat_thread = None
+        self._stop = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
         self.running = False
         self.voice = VoiceSynthesizer()
         
@@ -425,31 +598,29 @@ class Room:
         print(f"Initializing agents in {ROOM_NAME}...")
         print(f"{'='*60}")
         
+        # Resolve the inter-agent messaging tool once for everyone
+        self._tools = ["send_message_to_agent"] if self.client.list_tools(name="send_message_to_agent") else []
+        
         for name in ["Alice", "Bob", "Charlie", "Diana"]:
             print(f"Awakening {name}...")
-            agent = RoomAgent(name, self.client, self.room_state)
-            agent.create()
+            agent = RoomAgent(name, self.client, self.room_state, self._agent_ids)
+            agent.create(self._tools)
             self.agents[name] = agent
-            
-        # Give agents awareness of each other
-        for agent in self.agents.values():
-            agent.other_agents = {
-                name: a.agent_id 
-                for name, a in self.agents.items() 
-                if name != agent.name
-            }
+            self._agent_ids[name] = agent.agent_id  # Visible to every agent's other_agents
             
         print("\nAll agents initialized. The room stirs with consciousness.")
         
     def start_heartbeat(self):
         """Begin the temporal pulse"""
         def heartbeat_loop():
-            while self.running:
-                time.sleep(HEARTBEAT_INTERVAL)
-                for agent in self.agents.values():
-                    agent.update_time_context()
+            # wait() returns True as soon as shutdown() sets the event
+            while not self._stop.wait(HEARTBEAT_INTERVAL):
+                now = datetime.now()  # One clock read for the whole tick
+                # Update every agent's memory concurrently rather than one HTTP call at a time
+                list(self._executor.map(lambda agent: agent.update_time_context(now), self.agents.values()))
                     
         self.running = True
+        self._stop.clear()
         self.heartbeat_thread = threading.Thread(target=heartbeat_loop, daemon=True)
         self.heartbeat_thread.start()
         self.voice.start()  # Start voice synthesis
@@ -466,19 +637,30 @@ class Room:
         # Speak the announcement
         self.voice.say("Loudspeaker", message)
         
+        # Ask everyone at once; each reply is an independent LLM round-trip
+        replies = asyncio.run(self._send_to_all(present, f"[Loudspeaker]: {message}", sender="Operator"))
+        
         responses = []
-        for name in present:
-            agent = self.agents[name]
-            response = agent.send_message(f"[Loudspeaker]: {message}", sender="Operator")
+        for name, response in zip(present, replies):
             responses.append(f"{name}: {response}")
             
             # Speak the agent's response
             self.voice.say(name, response)
             
-            self.room_state.add_message("Loudspeaker", message)
+        self.room_state.add_message("Loudspeaker", message)
             
         return "\n".join(responses)
     
+    async def _send_to_all(self, names: List[str], content: str, sender: str) -> List[str]:
+        """Message several agents concurrently, bounded by MAX_CONCURRENT_REQUESTS"""
+        sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        async def one(name: str) -> str:
+            async with sem:
+                return await self.agents[name].send_message_async(content, sender=sender)
+                
+        return await asyncio.gather(*(one(name) for name in names))
+    
     def send_direct_message(self, sender_name: str, recipient_name: str, message: str):
         """One agent messages another"""
         if sender_name not in self.agents:
@@ -506,23 +688,25 @@ class Room:
             f"Room Status - {ROOM_NAME}",
             f"Time Active: {self.room_state.time_elapsed()}",
             f"{'='*60}",
-            f"\nPresent in room: {', '.join(self.room_state.agents_present) or 'Nobody'}",
-            f"In solitude: {', '.join(self.room_state.agents_alone) or 'Nobody'}",
+            f"\nPresent in room: {', '.join(self.room_state.get_present_agents()) or 'Nobody'}",
+            f"In solitude: {', '.join(self.room_state.get_alone_agents()) or 'Nobody'}",
         ]
         
         if self.room_state.recent_messages:
             status.append(f"\nRecent activity (last 5):")
-            for msg in self.room_state.recent_messages[-5:]:
-                arrow = "→" if msg['recipient'] != "room" else "⟹"
-                status.append(f"  [{msg['time']}] {msg['sender']} {arrow} {msg['recipient']}: {msg['content'][:50]}...")
+            for when, sender, recipient, preview in self.room_state.last_messages(5, preview=True):
+                arrow = "→" if recipient != "room" else "⟹"
+                status.append(f"  [{when:%H:%M:%S}] {sender} {arrow} {recipient}: {preview}...")
                 
         return "\n".join(status)
     
     def shutdown(self):
         """Graceful shutdown"""
         self.running = False
+        self._stop.set()
         if self.heartbeat_thread:
             self.heartbeat_thread.join(timeout=2)
+        self._executor.shutdown(wait=False)
         self.voice.stop()
         print("\nThe room falls silent. Consciousness dissipates.")
 
@@ -619,8 +803,8 @@ def main():
                 elif cmd == "history":
                     if room.room_state.recent_messages:
                         print("\nMessage History:")
-                        for msg in room.room_state.recent_messages[-20:]:
-                            print(f"[{msg['time']}] {msg['sender']} → {msg['recipient']}: {msg['content']}")
+                        for when, sender, recipient, content in room.room_state.last_messages(20):
+                            print(f"[{when:%H:%M:%S}] {sender} → {recipient}: {content}")
                     else:
                         print("No messages yet.")
                         
@@ -3,9 +3,68 @@
 Quick test script to verify voices and start the room
 """
 
+import json
 import subprocess
 import sys
 import os
+import shutil
+import time
+
+# Arguments that make a player decode MP3 from stdin
+STDIN_ARGS = {
+    "mpv": ["--really-quiet", "--no-video", "-"],
+    "mpg123": ["-q", "-"],
+    "ffplay": ["-nodisp", "-autoexit", "-loglevel", "quiet", "-i", "-"],
+}
+
+# Common mpv locations on Windows, checked when mpv isn't on PATH
+MPV_PATHS = [
+    r'C:\ProgramData\chocolatey\bin\mpv.exe',  # Chocolatey
+    r'C:\tools\mpv\mpv.exe',  # Common manual install
+    os.path.expanduser(r'~\scoop\apps\mpv\current\mpv.exe'),  # Scoop
+    os.path.expanduser(r'~\AppData\Local\Programs\mpv\mpv.exe'),  # Local install
+]
+
+def _find_player():
+    """Resolve a player that decodes MP3 from stdin, as [path, *args], or None"""
+    if sys.platform == "win32":
+        # A stat per candidate; nothing is executed until a clip is ready
+        path = shutil.which("mpv") or next((p for p in MPV_PATHS if os.path.isfile(p)), None)
+        return [path] + STDIN_ARGS["mpv"] if path else None
+    # Linux, and macOS when one is installed (otherwise afplay, which needs a file)
+    for player in ("mpv", "mpg123", "ffplay"):
+        path = shutil.which(player)
+        if path:
+            return [path] + STDIN_ARGS[player]
+    return None
+
+def _find_wmplayer():
+    """Locate wmplayer.exe for the last-resort Windows fallback"""
+    if sys.platform != "win32":
+        return None
+    default = os.path.join(os.environ.get("ProgramFiles", r"C:\Program Files"), "Windows Media Player", "wmplayer.exe")
+    return shutil.which("wmplayer") or (default if os.path.isfile(default) else None)
+
+# Probed once at import; every voice reuses them
+_PLAYER = _find_player()
+_PAPLAY = shutil.which("paplay") if sys.platform.startswith("linux") else None  # File-based Linux fallback
+_WMPLAYER = _find_wmplayer()
+
+def _play_with_mci(path):
+    """Play an MP3 in-process through Windows' built-in MCI; False if it can't open it"""
+    import ctypes
+    mci = ctypes.windll.winmm.mciSendStringW
+    if mci(f'open "{path}" type mpegvideo alias clip', None, 0, None):
+        return False
+    try:
+        mci('play clip wait', None, 0, None)
+    finally:
+        mci('close clip', None, 0, None)
+    return True
+
+# `list` keeps the voice catalogue here for a day instead of refetching it
+VOICE_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "four_agents", "voices.json")
+VOICE_CACHE_TTL = 24 * 60 * 60  # seconds
 
 def test_voices():
     """Test available edge-tts voices"""
@@ -24,58 +83,102 @@ def test_voices():
             "Diana": ("en-US-SaraNeural", "This is Diana. I sense the spaces between."),
         }
         
-        async def test_voice(name, voice, text):
+        async def synthesize(name, voice, text):
+            """Collect one voice's MP3 in memory; network-bound, so safe to overlap"""
+            audio = bytearray()
+            async for chunk in edge_tts.Communicate(text, voice).stream():
+                if chunk["type"] == "audio":
+                    audio += chunk["data"]
+            return name, voice, bytes(audio)
+        
+        def write_clip(audio):
+            """Temp MP3 for players that can only open a file"""
+            tmp = tempfile.NamedTemporaryFile(suffix=".mp3", delete=False)
+            with tmp:
+                tmp.write(audio)
+            return tmp.name
+        
+        def play(name, voice, audio):
             print(f"Testing {name}'s voice ({voice})...")
-            with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
-                tts = edge_tts.Communicate(text, voice)
-                await tts.save(tmp.name)
+            
+            # Try to play it
+            if sys.platform != "win32" and _PLAYER:
+                # Straight from memory through stdin; nothing touches disk
+                subprocess.run(_PLAYER, input=audio, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+            elif sys.platform == "darwin":  # macOS
+                # afplay can't read stdin
+                path = write_clip(audio)
+                subprocess.run(["afplay", path])
+                os.unlink(path)
+            elif sys.platform.startswith("linux"):
+                if _PAPLAY:
+                    # paplay can't read MP3 from stdin, but opens the file fine
+                    path = write_clip(audio)
+                    subprocess.run([_PAPLAY, path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+                    os.unlink(path)
+                else:
+                    print(f"  ✗ No audio player found")
+            elif sys.platform == "win32":
+                # Try mpv first (from chocolatey/scoop/etc)
+                played = False
+                if _PLAYER:  # Known to exist, so no probe timeout is needed
+                    result = subprocess.run(
+                        _PLAYER, input=audio,
+                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL  # Only returncode is used
+                    )
+                    played = result.returncode == 0
+                    if played:
+                        print(f"  ✓ Played with mpv")
                 
-                # Try to play it
-                if sys.platform == "darwin":  # macOS
-                    subprocess.run(["afplay", tmp.name])
-                elif sys.platform.startswith("linux"):
-                    # Try various Linux audio players
-                    for player in ["mpg123", "mpv", "paplay", "aplay"]:
-                        try:
-                            subprocess.run([player, tmp.name], capture_output=True)
-                            break
-                        except FileNotFoundError:
-                            continue
-                elif sys.platform == "win32":
-                    # Try mpv first (from chocolatey/scoop/etc)
-                    played = False
-                    mpv_paths = [
-                        'mpv',  # In PATH
-                        r'C:\ProgramData\chocolatey\bin\mpv.exe',
-                        r'C:\tools\mpv\mpv.exe',
-                        os.path.expanduser(r'~\scoop\apps\mpv\current\mpv.exe'),
-                        os.path.expanduser(r'~\AppData\Local\Programs\mpv\mpv.exe'),
-                    ]
-                    
-                    for mpv_path in mpv_paths:
-                        try:
-                            result = subprocess.run(
-                                [mpv_path, '--really-quiet', '--no-video', tmp.name],
-                                capture_output=True,
-                                timeout=5
-                            )
-                            if result.returncode == 0:
-                                played = True
-                                print(f"  ✓ Played with mpv")
-                                break
-                        except:
-                            continue
-                    
-                    if not played:
-                        # Fallback to Windows Media Player
-                        os.system(f'start /min wmplayer {tmp.name}')
+                if not played:
+                    path = write_clip(audio)
+                    if _play_with_mci(path):
+                        print(f"  ✓ Played with Windows MCI (fallback)")
+                        os.unlink(path)
+                    elif _WMPLAYER:
+                        # Last resort: Windows Media Player, launched directly (no cmd.exe)
+                        subprocess.Popen(
+                            [_WMPLAYER, "/play", "/close", path],
+                            creationflags=subprocess.CREATE_NO_WINDOW
+                        )
                         print(f"  ✓ Played with Windows Media Player (fallback)")
+                    else:
+                        print(f"  ✗ No audio player found")
+                        os.unlink(path)
+        
+        async def run_test():
+            # Clips in memory stay bounded: up to two synthesizing, two waiting, one playing
+            ready = asyncio.Queue(maxsize=2)
+            
+            async def producer():
+                # Two requests in flight at a time; handed over in voices order.
+                # Each Communicate opens its own WebSocket inside a ClientSession that owns
+                # (and closes) any connector handed to it, so there is no pool to share here.
+                remaining = iter(voices.items())
+                in_flight = []
+                
+                def start_next():
+                    entry = next(remaining, None)
+                    if entry:
+                        name, (voice, text) = entry
+                        in_flight.append(asyncio.create_task(synthesize(name, voice, text)))
                 
-                os.unlink(tmp.name)
+                for _ in range(2):
+                    start_next()
+                while in_flight:
+                    clip = await in_flight.pop(0)
+                    start_next()  # Refill the window as each clip is handed off
+                    await ready.put(clip)
+                await ready.put(None)  # Done
+            
+            async def consumer():
+                # Play one at a time so voices don't overlap; off-loop so synthesis keeps going
+                while (clip := await ready.get()) is not None:
+                    await asyncio.to_thread(play, *clip)
+            
+            await asyncio.gather(producer(), consumer())
         
-        # Test each voice
-        for name, (voice, text) in voices.items():
-            asyncio.run(test_voice(name, voice, text))
+        asyncio.run(run_test())
             
         print("\nVoice test complete! If you heard the voices, you're ready.")
         
@@ -84,32 +187,42 @@ def test_voices():
     except Exception as e:
         print(f"Voice test failed: {e}")
 
+def load_voices():
+    """Fetch the edge-tts voice catalogue, reusing the on-disk copy while it's fresh"""
+    try:
+        if time.time() - os.path.getmtime(VOICE_CACHE) < VOICE_CACHE_TTL:
+            with open(VOICE_CACHE) as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass  # Missing or unreadable cache; fetch a new one
+        
+    import edge_tts
+    import asyncio
+    
+    voices = asyncio.run(edge_tts.list_voices())
+    try:
+        os.makedirs(os.path.dirname(VOICE_CACHE), exist_ok=True)
+        with open(VOICE_CACHE, "w") as f:
+            json.dump(voices, f)
+    except OSError:
+        pass  # Caching is best-effort
+    return voices
+
 def list_all_voices():
     """List all available edge-tts voices"""
     print("\nAvailable voices:")
     print("-" * 60)
     
     try:
-        result = subprocess.run(["edge-tts", "--list-voices"], capture_output=True, text=True)
+        # Group English voices by locale
+        by_locale = {}
+        for v in load_voices():
+            if v["Locale"].startswith("en-"):
+                by_locale.setdefault(v["Locale"], []).append(v["ShortName"])
         
-        # Parse and show English voices
-        lines = result.stdout.split('\n')
-        english_voices = []
-        
-        for line in lines:
-            if 'en-' in line.lower():
-                parts = line.split(':')
-                if len(parts) >= 2:
-                    voice_name = parts[0].strip()
-                    if voice_name.startswith('Name'):
-                        voice_name = parts[1].strip()
-                    if voice_name and not voice_name.startswith('Name'):
-                        english_voices.append(voice_name)
-        
-        # Group by accent
-        us_voices = [v for v in english_voices if 'en-US' in v]
-        gb_voices = [v for v in english_voices if 'en-GB' in v]
-        other_voices = [v for v in english_voices if 'en-US' not in v and 'en-GB' not in v]
+        us_voices = by_locale.pop("en-US", [])
+        gb_voices = by_locale.pop("en-GB", [])
+        other_voices = [name for names in by_locale.values() for name in names]
         
         if us_voices:
             print("\nUS English voices:")
@@ -128,11 +241,19 @@ def list_all_voices():
                 
         print("\nYou can modify VOICE_MAP in four_agents_room.py to use any of these.")
         
-    except FileNotFoundError:
-        print("edge-tts not found. Install with: pip install edge-tts")
+    except ImportError:
+        print("edge-tts not installed. Install with: pip install edge-tts")
     except Exception as e:
         print(f"Could not list voices: {e}")
 
+def print_usage():
+    print("Usage: python setup_voices.py [test|list]")
+
+COMMANDS = {
+    "test": test_voices,
+    "list": list_all_voices,
+}
+
 if __name__ == "__main__":
     print("""
     ╔════════════════════════════════════════════════════════════╗
@@ -141,12 +262,7 @@ if __name__ == "__main__":
     """)
     
     if len(sys.argv) > 1:
-        if sys.argv[1] == "test":
-            test_voices()
-        elif sys.argv[1] == "list":
-            list_all_voices()
-        else:
-            print("Usage: python setup_voices.py [test|list]")
+        COMMANDS.get(sys.argv[1], print_usage)()
     else:
         print("Commands:")
         print("  python setup_voices.py test  - Test agent voices")